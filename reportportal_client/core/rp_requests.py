@@ -24,6 +24,7 @@ import uuid
 
 from reportportal_client.core.rp_file import RPFile
 from reportportal_client.core.rp_issues import Issue
+from reportportal_client.helpers import json_body_kwargs
 from reportportal_client.static.abstract import (
     AbstractBaseClass,
     abstractmethod
@@ -36,24 +37,39 @@ from .rp_responses import RPResponse
 class HttpRequest:
     """This model stores attributes related to RP HTTP requests."""
 
-    def __init__(self, session_method, url, data=None, json=None):
+    def __init__(self, session_method, url, data=None, json=None,
+                 files=None, verify_ssl=True, compress_threshold=None):
         """Initialize instance attributes.
 
-        :param session_method: Method of the requests.Session instance
-        :param url:            Request URL
-        :param data:           Dictionary, list of tuples, bytes, or file-like
-                               object to send in the body of the request
-        :param json:           JSON to be send in the body of the request
+        :param session_method:     Method of the requests.Session instance
+        :param url:                Request URL
+        :param data:               Dictionary, list of tuples, bytes, or
+                                   file-like object to send in the body of
+                                   the request
+        :param json:               JSON to be send in the body of the request
+        :param files:              Files for the multipart-encoded request
+        :param verify_ssl:         Whether to verify SSL certificates
+        :param compress_threshold: Minimal size of the JSON body in bytes to
+                                   send it gzip-compressed. None disables
+                                   the compression
         """
+        self.compress_threshold = compress_threshold
         self.data = data
+        self.files = files
         self.json = json
         self.session_method = session_method
         self.url = url
+        self.verify_ssl = verify_ssl
 
     def make(self):
         """Make HTTP request to the Report Portal API."""
+        if self.json is None:
+            return RPResponse(self.session_method(
+                self.url, data=self.data, files=self.files,
+                verify=self.verify_ssl))
         return RPResponse(self.session_method(
-            self.url, data=self.data, json=self.json))
+            self.url, verify=self.verify_ssl,
+            **json_body_kwargs(self.json, self.compress_threshold)))
 
 
 class RPRequestBase(object):
@@ -107,6 +123,23 @@ class RPRequestBase(object):
         raise NotImplementedError('Payload interface is not implemented!')
 
 
+class RPRequest(RPRequestBase):
+    """RP request model for the already formed payload."""
+
+    def __init__(self, payload=None):
+        """Initialize instance attributes.
+
+        :param payload: HTTP payload of the request
+        """
+        super(RPRequest, self).__init__()
+        self._payload = payload
+
+    @property
+    def payload(self):
+        """Get HTTP payload for the request."""
+        return self._payload
+
+
 class LaunchStartRequest(RPRequestBase):
     """RP start launch request model.
 
@@ -19,9 +19,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from reportportal_client.static.defines import NOT_FOUND
+from reportportal_client.static.defines import NOT_FOUND, NOT_SET
 from reportportal_client.static.errors import ResponseError
 
+ERROR_CODE_MARKER = b'"errorCode"'
+
 
 class RPMessage(object):
     """Model for the message returned by RP API."""
@@ -33,7 +35,7 @@ class RPMessage(object):
 
         :param data: Dictionary representation of the API response
         """
-        self.error_code = data.get('error_code', NOT_FOUND)
+        self.error_code = data.get('errorCode', NOT_FOUND)
         self.message = data.get('message', NOT_FOUND)
 
     def __str__(self):
@@ -50,7 +52,11 @@ class RPMessage(object):
 
 
 class RPResponse(object):
-    """Class representing RP API response."""
+    """Class representing RP API response.
+
+    The body of the response is parsed on the first access to the JSON data,
+    so the responses nobody reads cost nothing.
+    """
 
     __slots__ = ['_data', '_resp']
 
@@ -59,7 +65,7 @@ class RPResponse(object):
 
         :param data: requests.Response object
         """
-        self._data = self._get_json(data)
+        self._data = NOT_SET
         self._resp = data
 
     @staticmethod
@@ -69,7 +75,7 @@ class RPResponse(object):
         :param data: requests.Response object
         :return:     dict
         """
-        if not data.text:
+        if not data.content:
             return {}
         try:
             return data.json()
@@ -82,6 +88,18 @@ class RPResponse(object):
         """Get value of the 'id' key."""
         return self.json.get('id', NOT_FOUND)
 
+    @property
+    def errors(self):
+        """Get list of error messages received.
+
+        The body is scanned for the error code field before parsing, so
+        successful responses are not decoded at all.
+        """
+        if ERROR_CODE_MARKER not in self._resp.content:
+            return ()
+        return tuple(message for message in self.messages
+                     if message.error_code is not NOT_FOUND)
+
     @property
     def is_success(self):
         """Check if response to API has been successful."""
@@ -98,6 +116,8 @@ class RPResponse(object):
     @property
     def json(self):
         """Get the response in dictionary."""
+        if self._data is NOT_SET:
+            self._data = self._get_json(self._resp)
         return self._data
 
     @property
@@ -109,3 +129,8 @@ class RPResponse(object):
     def messages(self):
         """Get list of messages received."""
         return tuple(self._iter_messages())
+
+    @property
+    def status_code(self):
+        """Get HTTP status code of the response."""
+        return self._resp.status_code
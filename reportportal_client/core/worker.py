@@ -15,11 +15,13 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from enum import auto, Enum, unique
+from enum import Enum, unique
 import logging
 from threading import currentThread, Thread
-from queue import Empty
 
+from six.moves.queue import Empty
+
+QUEUE_POLL_TIMEOUT = 0.1
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
@@ -28,11 +30,11 @@ logger.addHandler(logging.NullHandler())
 class ControlCommand(Enum):
     """This class stores worker control commands."""
 
-    CLEAR_QUEUE = auto()
-    NOP = auto()
-    REPORT_STATUS = auto()
-    STOP = auto()
-    STOP_IMMEDIATE = auto()
+    CLEAR_QUEUE = 1
+    NOP = 2
+    REPORT_STATUS = 3
+    STOP = 4
+    STOP_IMMEDIATE = 5
 
     def is_stop_cmd(self):
         """Verify if the command is the stop one."""
@@ -101,13 +103,18 @@ class APIWorker(object):
                              self.name, cmd)
                 break
 
-            request = self._request_get()
+            request = self._request_get(timeout=QUEUE_POLL_TIMEOUT)
             self._request_process(request)
 
-    def _request_get(self):
-        """Get response object from the data queue."""
+    def _request_get(self, timeout=None):
+        """Get response object from the data queue.
+
+        :param timeout: Time in seconds to wait for a request. Do not wait
+                        if it is None
+        """
         try:
-            _, request = self._data_queue.get_nowait()
+            request = self._data_queue.get(block=timeout is not None,
+                                           timeout=timeout)
             logger.debug('[%s] Received {%s} request', self.name, request)
             return request
         except Empty:
@@ -119,8 +126,18 @@ class APIWorker(object):
             return  # No request received
 
         logger.debug('[%s] Processing {%s} request', self.name, request)
-        request.response = request.http_request.make()
-        self._data_queue.task_done()
+        try:
+            request.response = response = request.http_request.make()
+            errors = response.errors
+            if errors or not response.is_success:
+                logger.warning('[%s] Request {%s} failed with status %s: %s',
+                               self.name, request, response.status_code,
+                               '; '.join(map(str, errors)))
+        except Exception as exc:
+            logger.warning('[%s] Failed to process {%s} request: %s',
+                           self.name, request, exc)
+        finally:
+            self._data_queue.task_done()
 
     def _stop(self):
         """Routine that stops the worker thread(s).
@@ -129,7 +146,7 @@ class APIWorker(object):
         Note that if you don't call this before your application exits, there
         may be some records still left on the queue, which won't be processed.
         """
-        if self._thread.isAlive() and self._thread is not currentThread():
+        if self._thread.is_alive() and self._thread is not currentThread():
             self._thread.join()
         self._thread = None
 
@@ -144,6 +161,10 @@ class APIWorker(object):
         """
         self._data_queue.put(request)
 
+    def wait(self):
+        """Block until all the requests from the data queue are processed."""
+        self._data_queue.join()
+
     def start(self):
         """Start the worker.
 
@@ -151,7 +172,7 @@ class APIWorker(object):
         requests to process.
         """
         self._thread = Thread(target=self._monitor)
-        self._thread.setDaemon(True)
+        self._thread.daemon = True
         self._thread.start()
 
     def stop(self):
@@ -11,6 +11,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import gzip
+import json
 import logging
 import uuid
 from pkg_resources import DistributionNotFound, get_distribution
@@ -110,6 +112,42 @@ def get_package_version(package_name):
     return package_version
 
 
+def gzip_compress(data, compresslevel=6):
+    """Compress the given bytes with gzip.
+
+    :param data:          Bytes to compress
+    :param compresslevel: Compression level from 1 (fastest) to 9 (smallest)
+    :return:              Compressed bytes
+    """
+    buf = six.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb',
+                       compresslevel=compresslevel) as gz_file:
+        gz_file.write(data)
+    return buf.getvalue()
+
+
+def json_body_kwargs(json_data, compress_threshold=None):
+    """Form keyword arguments for sending the given JSON body.
+
+    If the encoded body is at least 'compress_threshold' bytes long it is
+    compressed with gzip and sent with the 'Content-Encoding' header.
+    Shorter bodies are sent encoded, so they are not serialized twice.
+
+    :param json_data:          JSON serializable object
+    :param compress_threshold: Minimal size of the body in bytes to compress
+                               it. None disables the compression
+    :return:                   dict of keyword arguments for a requests method
+    """
+    if compress_threshold is None:
+        return {'json': json_data}
+    body = json.dumps(json_data).encode('utf-8')
+    headers = {'Content-Type': 'application/json'}
+    if len(body) >= compress_threshold:
+        body = gzip_compress(body)
+        headers['Content-Encoding'] = 'gzip'
+    return {'data': body, 'headers': headers}
+
+
 def verify_value_length(attributes):
     """Verify length of the attribute value.
 
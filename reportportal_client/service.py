@@ -22,11 +22,15 @@ import uuid
 import logging
 
 import six
+from six.moves import queue
 from six.moves.collections_abc import Mapping
 from requests.adapters import HTTPAdapter
 
+from .core.rp_requests import HttpRequest, RPRequest
+from .core.rp_responses import ERROR_CODE_MARKER
+from .core.worker import APIWorker
 from .errors import ResponseError, EntryCreatedError, OperationCompletionError
-from .helpers import verify_value_length
+from .helpers import generate_uuid, json_body_kwargs, verify_value_length
 
 POST_LOGBATCH_RETRY_COUNT = 10
 logger = logging.getLogger(__name__)
@@ -117,7 +121,7 @@ def _get_json(response):
     :return: data: json object
     """
     try:
-        if response.text:
+        if response.content:
             return response.json()
         else:
             return {}
@@ -126,6 +130,20 @@ def _get_json(response):
             "Invalid response: {0}: {1}".format(value_error, response.text))
 
 
+def _check_response(response):
+    """
+    Check Response for errors without parsing successful responses.
+
+    The body is parsed only if the request failed or the body contains
+    the error code field.
+
+    :param response: Response object
+    """
+    if response.ok and ERROR_CODE_MARKER not in response.content:
+        return
+    _get_data(response)
+
+
 def _get_messages(data):
     """
     Get messages (ErrorCode) from Response.
@@ -172,6 +190,9 @@ class ReportPortalService(object):
                  verify_ssl=True,
                  retries=None,
                  max_pool_size=50,
+                 compress_threshold=None,
+                 non_blocking=False,
+                 discard_log_responses=False,
                  **kwargs):
         """Init the service class.
 
@@ -186,6 +207,15 @@ class ReportPortalService(object):
             verify_ssl: option to not verify ssl certificates
             max_pool_size: option to set the maximum number of
                            connections to save in the pool.
+            compress_threshold: option to gzip JSON request bodies which
+                                size in bytes is not less than the given
+                                value. Compression is disabled by default.
+            non_blocking: option to send test item and log requests from
+                          a background thread. Test items get client-side
+                          generated UUIDs, which are returned immediately.
+            discard_log_responses: option to only check log batch responses
+                                   for errors instead of parsing and
+                                   returning them.
 
         """
         self._batch_logs = []
@@ -206,10 +236,58 @@ class ReportPortalService(object):
         self.session.headers["Authorization"] = "bearer {0}".format(self.token)
         self.launch_id = kwargs.get('launch_id')
         self.verify_ssl = verify_ssl
+        self.compress_threshold = compress_threshold
+        self.discard_log_responses = discard_log_responses
+        self._worker = None
+        if non_blocking:
+            self._worker = APIWorker(queue.Queue(), queue.Queue())
+            self._worker.start()
+
+    @property
+    def non_blocking(self):
+        """Check if the requests are sent from the background thread."""
+        return self._worker is not None
+
+    def _send_request(self, session_method, url, json=None, files=None):
+        """Put the request to the queue of the background worker.
+
+        Requests are sent one by one in the order they have been queued, so
+        a child item is always started after its parent on the server side.
+
+        :param session_method: Method of the requests.Session instance
+        :param url:            Request URL
+        :param json:           JSON body of the request
+        :param files:          Files for the multipart-encoded request
+        """
+        request = RPRequest(json)
+        request.http_request = HttpRequest(
+            session_method, url, json=json, files=files,
+            verify_ssl=self.verify_ssl,
+            compress_threshold=self.compress_threshold)
+        self._worker.send_request(request)
+
+    def _wait_requests(self):
+        """Wait until the background worker sends all queued requests."""
+        if self._worker:
+            self._worker.wait()
+
+    def _json_kwargs(self, data):
+        """Form keyword arguments for sending the given JSON data.
+
+        :param data: JSON serializable request body
+        :return:     dict of keyword arguments for the session methods
+        """
+        return json_body_kwargs(data, self.compress_threshold)
 
     def terminate(self, *args, **kwargs):
-        """Call this to terminate the service."""
-        pass
+        """Call this to terminate the service.
+
+        In the non-blocking mode it waits until all queued requests are sent
+        and stops the background worker.
+        """
+        if self._worker:
+            self._wait_requests()
+            self._worker.stop()
 
     def start_launch(self,
                      name,
@@ -233,7 +311,8 @@ class ReportPortalService(object):
             "rerunOf": rerunOf
         }
         url = uri_join(self.base_url_v2, "launch")
-        r = self.session.post(url=url, json=data, verify=self.verify_ssl)
+        r = self.session.post(url=url, verify=self.verify_ssl,
+                              **self._json_kwargs(data))
         self.launch_id = _get_id(r)
         logger.debug("start_launch - ID: %s", self.launch_id)
         return self.launch_id
@@ -247,6 +326,7 @@ class ReportPortalService(object):
         # process log batches firstly:
         if self._batch_logs:
             self.log_batch([], force=True)
+        self._wait_requests()
         if attributes and isinstance(attributes, dict):
             attributes = _dict_to_payload(attributes)
         data = {
@@ -255,7 +335,8 @@ class ReportPortalService(object):
             "attributes": verify_value_length(attributes)
         }
         url = uri_join(self.base_url_v2, "launch", self.launch_id, "finish")
-        r = self.session.put(url=url, json=data, verify=self.verify_ssl)
+        r = self.session.put(url=url, verify=self.verify_ssl,
+                             **self._json_kwargs(data))
         logger.debug("finish_launch - ID: %s", self.launch_id)
         return _get_msg(r)
 
@@ -359,7 +440,13 @@ class ReportPortalService(object):
             url = uri_join(self.base_url_v2, "item", parent_item_id)
         else:
             url = uri_join(self.base_url_v2, "item")
-        r = self.session.post(url=url, json=data, verify=self.verify_ssl)
+        if self.non_blocking:
+            item_id = data["uuid"] = generate_uuid()
+            self._send_request(self.session.post, url, json=data)
+            logger.debug("start_test_item - UUID: %s (queued)", item_id)
+            return item_id
+        r = self.session.post(url=url, verify=self.verify_ssl,
+                              **self._json_kwargs(data))
 
         item_id = _get_id(r)
         logger.debug("start_test_item - ID: %s", item_id)
@@ -379,7 +466,8 @@ class ReportPortalService(object):
         }
         item_id = self.get_item_id_by_uuid(item_uuid)
         url = uri_join(self.base_url_v1, "item", item_id, "update")
-        r = self.session.put(url=url, json=data, verify=self.verify_ssl)
+        r = self.session.put(url=url, verify=self.verify_ssl,
+                             **self._json_kwargs(data))
         logger.debug("update_test_item - Item: %s", item_id)
         return _get_msg(r)
 
@@ -398,7 +486,7 @@ class ReportPortalService(object):
         :param issue:      description of an issue
         :param attributes: list of attributes
         :param kwargs:     other parameters
-        :return:           json message
+        :return:           json message, None in the non-blocking mode
 
         """
         # check if skipped test should not be marked as "TO INVESTIGATE"
@@ -417,7 +505,12 @@ class ReportPortalService(object):
             "attributes": verify_value_length(attributes)
         }
         url = uri_join(self.base_url_v2, "item", item_id)
-        r = self.session.put(url=url, json=data, verify=self.verify_ssl)
+        if self.non_blocking:
+            self._send_request(self.session.put, url, json=data)
+            logger.debug("finish_test_item - ID: %s (queued)", item_id)
+            return None
+        r = self.session.put(url=url, verify=self.verify_ssl,
+                             **self._json_kwargs(data))
         logger.debug("finish_test_item - ID: %s", item_id)
         return _get_msg(r)
 
@@ -427,6 +520,8 @@ class ReportPortalService(object):
         :param str uuid: UUID returned on the item start
         :return str:     Test item id
         """
+        # The item can be started in background and not reported yet
+        self._wait_requests()
         url = uri_join(self.base_url_v1, "item", "uuid", uuid)
         return _get_json(self.session.get(
             url=url, verify=self.verify_ssl))["id"]
@@ -451,7 +546,7 @@ class ReportPortalService(object):
         :param level:
         :param attachment: files
         :param item_id:  id of item
-        :return: id of item from response
+        :return: id of item from response, None in the non-blocking mode
         """
         data = {
             "launchUuid": self.launch_id,
@@ -464,11 +559,15 @@ class ReportPortalService(object):
         if attachment:
             data["attachment"] = attachment
             return self.log_batch([data], item_id=item_id)
-        else:
-            url = uri_join(self.base_url_v2, "log")
-            r = self.session.post(url=url, json=data, verify=self.verify_ssl)
-            logger.debug("log - ID: %s", item_id)
-            return _get_id(r)
+        url = uri_join(self.base_url_v2, "log")
+        if self.non_blocking:
+            self._send_request(self.session.post, url, json=data)
+            logger.debug("log - ID: %s (queued)", item_id)
+            return None
+        r = self.session.post(url=url, verify=self.verify_ssl,
+                              **self._json_kwargs(data))
+        logger.debug("log - ID: %s", item_id)
+        return _get_id(r)
 
     def log_batch(self, log_data, item_id=None, force=False):
         """
@@ -521,6 +620,11 @@ class ReportPortalService(object):
             )
         )]
         files.extend(attachments)
+        if self.non_blocking:
+            self._send_request(self.session.post, url, files=files)
+            logger.debug("log_batch - ID: %s (queued)", item_id)
+            self._batch_logs = []
+            return
         for i in range(POST_LOGBATCH_RETRY_COUNT):
             try:
                 r = self.session.post(
@@ -529,8 +633,10 @@ class ReportPortalService(object):
                     verify=self.verify_ssl
                 )
                 logger.debug("log_batch - ID: %s", item_id)
-                logger.debug("log_batch response: %s", r.text)
                 self._batch_logs = []
+                if self.discard_log_responses:
+                    return _check_response(r)
+                logger.debug("log_batch response: %s", r.text)
                 return _get_data(r)
             except KeyError:
                 if i < POST_LOGBATCH_RETRY_COUNT - 1:
@@ -1,11 +1,16 @@
 """This modules contains unit tests for the helpers module."""
 
+import gzip
+import json
+
+import six
 from six.moves import mock
 
 from reportportal_client.helpers import (
     gen_attributes,
     get_launch_sys_attrs,
     get_package_version,
+    json_body_kwargs,
     verify_value_length
 )
 
@@ -59,3 +64,28 @@ def test_verify_value_length():
     expected = [{'key': 'tn', 'value': 'v' * 128}, [1, 2],
                 {'value': 'tv2'}, {'value': 300}]
     assert verify_value_length(inputl) == expected
+
+
+def test_json_body_kwargs_no_compression():
+    """Test that JSON body is passed as is if compression is disabled."""
+    data = {'name': 'Test'}
+    assert json_body_kwargs(data) == {'json': data}
+
+
+def test_json_body_kwargs_below_threshold():
+    """Test that short JSON body is encoded, but not compressed."""
+    data = {'name': 'Test'}
+    result = json_body_kwargs(data, compress_threshold=1024)
+    assert 'Content-Encoding' not in result['headers']
+    assert json.loads(result['data'].decode('utf-8')) == data
+
+
+def test_json_body_kwargs_compressed():
+    """Test that long JSON body is sent gzip-compressed."""
+    data = {'description': 'd' * 2048}
+    result = json_body_kwargs(data, compress_threshold=1024)
+    assert result['headers'] == {'Content-Encoding': 'gzip',
+                                 'Content-Type': 'application/json'}
+    assert len(result['data']) < 1024
+    with gzip.GzipFile(fileobj=six.BytesIO(result['data'])) as gz_file:
+        assert json.loads(gz_file.read().decode('utf-8')) == data
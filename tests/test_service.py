@@ -7,6 +7,7 @@ import pytest
 from six.moves import mock
 
 from reportportal_client.service import (
+    ReportPortalService,
     _convert_string,
     _dict_to_payload,
     _get_data,
@@ -300,3 +301,39 @@ class TestReportPortalService:
                                verify=True)
         expected_result['json'][expected_name] = expected_value
         rp_service.session.post.assert_called_with(**expected_result)
+
+    @mock.patch('reportportal_client.service._get_data',
+                mock.Mock(return_value={'id': 123}))
+    def test_start_item_compressed(self):
+        """Test that start_test_item sends large bodies gzip-compressed."""
+        service = ReportPortalService('http://endpoint', 'project', 'token',
+                                      compress_threshold=0)
+        service.session = mock.Mock()
+        service.start_test_item(name='name', start_time=1591032041348,
+                                item_type='STORY')
+        kwargs = service.session.post.call_args[1]
+        assert 'json' not in kwargs
+        assert kwargs['headers']['Content-Encoding'] == 'gzip'
+
+    def test_start_item_non_blocking(self):
+        """Test that items are started in background with client UUIDs."""
+        service = ReportPortalService('http://endpoint', 'project', 'token',
+                                      non_blocking=True)
+        service.session = mock.Mock()
+        service.session.post.return_value.content = b''
+        parent_id = service.start_test_item(name='suite',
+                                            start_time=1591032041348,
+                                            item_type='SUITE')
+        child_id = service.start_test_item(name='test',
+                                           start_time=1591032041348,
+                                           item_type='STEP',
+                                           parent_item_id=parent_id)
+        service.terminate()
+
+        calls = service.session.post.call_args_list
+        expect(len(calls) == 2)
+        expect(calls[0][1]['json']['uuid'] == parent_id)
+        expect(calls[1][0][0] ==
+               'http://endpoint/api/v2/project/item/' + parent_id)
+        expect(calls[1][1]['json']['uuid'] == child_id)
+        assert_expectations()